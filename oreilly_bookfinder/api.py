@@ -1,13 +1,77 @@
 """O'Reilly API interaction module."""
 import requests
+import numpy as np
 import pandas as pd
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, Optional, List
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
+from .topics import get_available_topics  # noqa: F401 - re-exported for api users
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+try:
+    import requests_cache
+except ImportError:  # pragma: no cover - optional dependency
+    requests_cache = None
 
 OREILLY_API_URL = "https://learning.oreilly.com/api/v2/search/"
 
+# (connect, read) timeouts in seconds for API requests
+REQUEST_TIMEOUT = (3.05, 30)
+
+# Maximum number of result pages fetched concurrently
+MAX_CONCURRENT_PAGES = 8
+
+# On-disk cache for API responses (used when requests-cache is installed)
+CACHE_NAME = "~/.cache/oreilly_bf"
+CACHE_EXPIRE_AFTER = timedelta(hours=6)
+
+# Longest wait in seconds honored from a server's Retry-After header
+MAX_RETRY_AFTER = 10
+
+class _CappedRetry(Retry):
+    """Retry policy that caps Retry-After waits at MAX_RETRY_AFTER seconds."""
+    
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_AFTER)
+
+# Retry transient failures with exponential backoff, honoring (capped)
+# Retry-After on 429/503; once retries run out the last response is returned
+# so that raise_for_status reports the final HTTP error
+_RETRY = _CappedRetry(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=("GET",),
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
+
+# Shared session so repeated searches reuse keep-alive connections and
+# identical queries are served from the local cache. Created on first use
+# so importing this module doesn't create the on-disk cache.
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
 # Default topics for data science and AI
-DEFAULT_TOPICS = [
+DEFAULT_TOPICS = (
     "data-science",
     "machine-learning",
     "artificial-intelligence",
@@ -15,10 +79,13 @@ DEFAULT_TOPICS = [
     "deep-learning",
     "statistics",
     "big-data"
-]
+)
+
+# Topic filter for the default topics, built once since they never change
+_DEFAULT_TOPIC_FILTERS = " ".join(f"topic:{topic}" for topic in DEFAULT_TOPICS)
 
 # Columns to include in CSV export
-CSV_COLUMNS = [
+CSV_COLUMNS = (
     'title',
     'authors',
     'issued',
@@ -28,12 +95,150 @@ CSV_COLUMNS = [
     'web_url',
     'archive_id',
     'format'
-]
+)
+
+# Columns holding lists of strings, normalized to lists when results are loaded
+LIST_COLUMNS = ('authors', 'topics')
+
+# DataFrame.attrs flag set by search_books once LIST_COLUMNS hold only lists
+_LISTS_NORMALIZED_ATTR = "oreilly_bookfinder_lists_normalized"
+
+# Readable CSV headers for exported columns
+_COLUMN_NAMES = {
+    'title': 'Title',
+    'authors': 'Authors',
+    'issued': 'Published Date',
+    'publisher': 'Publisher',
+    'description': 'Description',
+    'topics': 'Topics',
+    'web_url': 'URL',
+    'archive_id': 'Archive ID',
+    'format': 'Format'
+}
+
+def _get_session() -> requests.Session:
+    """Return the shared HTTP session, creating it on first use."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            if requests_cache is not None:
+                session = requests_cache.CachedSession(
+                    cache_name=CACHE_NAME,
+                    backend="sqlite",
+                    expire_after=CACHE_EXPIRE_AFTER,
+                    allowable_methods=("GET",)
+                )
+            else:
+                session = requests.Session()
+            session.mount("https://", HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=_RETRY
+            ))
+            _SESSION = session
+        return _SESSION
+
+def close() -> None:
+    """Close the shared HTTP session, if one was created, and release pooled connections."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is not None:
+            _SESSION.close()
+            _SESSION = None
+
+def _cache_context(use_cache: bool):
+    """Return a context manager that bypasses the response cache if requested."""
+    session = _get_session()
+    if use_cache or not hasattr(session, "cache_disabled"):
+        return nullcontext()
+    return session.cache_disabled()
+
+def _flatten(d: Dict, prefix: str = "", out: Optional[Dict] = None, max_level: int = 1) -> Dict:
+    """
+    Flatten nested dicts into a single dict with "_"-joined keys.
+    
+    Args:
+        d: Dict to flatten
+        prefix: Key prefix for the current nesting level
+        out: Dict to write flattened keys into (default: new dict)
+        max_level: Number of nested levels to flatten; deeper dicts are kept as values
+        
+    Returns:
+        Flattened dict
+    """
+    if out is None:
+        out = {}
+    for key, value in d.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict) and max_level > 0:
+            _flatten(value, f"{name}_", out, max_level - 1)
+        else:
+            out[name] = value
+    return out
+
+def _fetch_results(params: Dict) -> List[Dict]:
+    """Fetch a single page of search results from the O'Reilly API."""
+    response = _get_session().get(OREILLY_API_URL, params=params, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    
+    data = orjson.loads(response.content) if orjson is not None else response.json()
+    
+    # Extract the results from the response
+    return data.get("results", [])
 
 def format_date(d: date) -> str:
     """Format date for O'Reilly API query."""
     return d.strftime("%Y-%m-%d")
 
+def _as_list(value) -> List:
+    """Convert a cell to a list, wrapping scalars and mapping missing values to an empty list."""
+    if isinstance(value, list):
+        return value
+    if isinstance(value, (tuple, np.ndarray)):
+        return list(value)
+    return [value] if pd.notna(value) else []
+
+def _join_list_column(series: pd.Series, normalized: bool) -> pd.Series:
+    """Join a column of string lists into comma-separated strings."""
+    # Frames from search_books already hold lists; normalize anything else first
+    if not normalized:
+        series = series.map(_as_list)
+    return series.str.join(', ')
+
+def _format_issued_date(value) -> Optional[str]:
+    """Format a single timestamp as YYYY-MM-DD, or None if it can't be parsed."""
+    try:
+        return pd.Timestamp(value).strftime('%Y-%m-%d')
+    except (ValueError, TypeError):
+        return None
+
+def _format_issued_dates(series: pd.Series) -> pd.Series:
+    """
+    Format ISO-8601 timestamps as YYYY-MM-DD dates in each timestamp's own offset.
+    
+    Args:
+        series: Column of timestamp strings
+        
+    Returns:
+        Column of date strings, with unparseable values left blank
+    """
+    # The API returns ISO-8601 timestamps; naming the format skips per-row
+    # inference. Timestamps are not converted to UTC so the day never shifts.
+    try:
+        with warnings.catch_warnings():
+            # pandas < 3 warns and returns objects for mixed offsets
+            warnings.simplefilter("ignore", FutureWarning)
+            parsed = pd.to_datetime(series, format="ISO8601", errors="coerce")
+    except ValueError:
+        # pandas >= 3 raises for mixed offsets
+        parsed = None
+    
+    if parsed is not None and pd.api.types.is_datetime64_any_dtype(parsed):
+        return parsed.dt.strftime('%Y-%m-%d')
+    
+    # Mixed offsets can't share a datetime column, so format each value on its own
+    return series.map(_format_issued_date)
+
 def prepare_dataframe_for_export(df: pd.DataFrame) -> pd.DataFrame:
     """
     Prepare DataFrame for CSV export by cleaning and organizing columns.
@@ -47,41 +252,54 @@ def prepare_dataframe_for_export(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
         return df
         
-    # Create a copy to avoid modifying the original
-    export_df = df.copy()
+    # Select and order columns that exist in the DataFrame, copying only
+    # those so the original is left unmodified
+    available_columns = [col for col in CSV_COLUMNS if col in df.columns]
+    export_df = df[available_columns].copy()
+    
+    normalized = df.attrs.get(_LISTS_NORMALIZED_ATTR, False)
     
     # Convert authors list to comma-separated string
     if 'authors' in export_df.columns:
-        export_df['authors'] = export_df['authors'].apply(lambda x: ', '.join(x) if isinstance(x, list) else x)
+        export_df['authors'] = _join_list_column(export_df['authors'], normalized)
     
     # Convert topics list to comma-separated string
     if 'topics' in export_df.columns:
-        export_df['topics'] = export_df['topics'].apply(lambda x: ', '.join(x) if isinstance(x, list) else x)
+        export_df['topics'] = _join_list_column(export_df['topics'], normalized)
     
     # Format dates
     if 'issued' in export_df.columns:
-        export_df['issued'] = pd.to_datetime(export_df['issued']).dt.strftime('%Y-%m-%d')
-    
-    # Select and order columns that exist in the DataFrame
-    available_columns = [col for col in CSV_COLUMNS if col in export_df.columns]
-    export_df = export_df[available_columns]
+        export_df['issued'] = _format_issued_dates(export_df['issued'])
     
     # Clean up column names for better readability
-    column_names = {
-        'title': 'Title',
-        'authors': 'Authors',
-        'issued': 'Published Date',
-        'publisher': 'Publisher',
-        'description': 'Description',
-        'topics': 'Topics',
-        'web_url': 'URL',
-        'archive_id': 'Archive ID',
-        'format': 'Format'
-    }
-    export_df = export_df.rename(columns={col: column_names.get(col, col) for col in export_df.columns})
+    export_df = export_df.rename(columns=_COLUMN_NAMES)
     
     return export_df
 
+def write_csv(df: pd.DataFrame, path: str) -> None:
+    """
+    Write a DataFrame to a CSV file, using pyarrow's CSV writer when available.
+    
+    Falls back to DataFrame.to_csv when pyarrow is not installed or cannot
+    convert the frame (e.g. an object column mixing strings and numbers).
+    The two writers format some values differently: pyarrow quotes every
+    header and string field and writes booleans as true/false, while to_csv
+    quotes only fields that need it and writes True/False.
+    
+    Args:
+        df: DataFrame to write (typically from prepare_dataframe_for_export)
+        path: Destination file path
+    """
+    if pa is not None:
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass
+        else:
+            pacsv.write_csv(table, path)
+            return
+    df.to_csv(path, index=False)
+
 def search_books(
     query: str = "",
     author: Optional[str] = None,
@@ -93,7 +311,10 @@ def search_books(
     topics: Optional[List[str]] = None,
     use_default_topics: bool = True,
     export_to_csv: bool = False,
-    csv_filename: str = "oreilly_books.csv"
+    csv_filename: str = "oreilly_books.csv",
+    use_cache: bool = True,
+    pages: int = 1,
+    dtype_backend: Optional[str] = None
 ) -> pd.DataFrame:
     """
     Search for books on O'Reilly's platform and return results as a DataFrame.
@@ -110,10 +331,21 @@ def search_books(
         use_default_topics: Whether to use default data science/AI topics when no topics provided
         export_to_csv: Whether to export results to a CSV file (default: False)
         csv_filename: Filename for CSV export (default: "oreilly_books.csv")
+        use_cache: Whether to serve repeat queries from the local response cache (default: True)
+        pages: Number of consecutive pages to fetch, starting at `page` (default: 1)
+        dtype_backend: Pass "pyarrow" (requires pyarrow) or "numpy_nullable" to convert
+            columns with DataFrame.convert_dtypes; None keeps plain NumPy/object
+            columns (default: None)
     
     Returns:
         pandas DataFrame containing search results
+        
+    Raises:
+        ValueError: If `pages` is less than 1
     """
+    if pages < 1:
+        raise ValueError("pages must be at least 1")
+    
     # Build the search query
     search_query = []
     
@@ -151,64 +383,43 @@ def search_books(
         
     if topics:
         # Add topic filters to query using O'Reilly's topic syntax
-        topic_filters = " ".join(f"topic:{topic}" for topic in topics)
+        if topics is DEFAULT_TOPICS:
+            topic_filters = _DEFAULT_TOPIC_FILTERS
+        else:
+            topic_filters = " ".join(f"topic:{topic}" for topic in topics)
         params["query"] = f"{params['query']} {topic_filters}"
     
-    response = requests.get(OREILLY_API_URL, params=params)
-    response.raise_for_status()
+    # Fetch the requested pages, concurrently when more than one is needed
+    with _cache_context(use_cache):
+        if pages > 1:
+            page_params = [{**params, "page": p} for p in range(page, page + pages)]
+            with ThreadPoolExecutor(max_workers=min(pages, MAX_CONCURRENT_PAGES)) as executor:
+                page_results = list(executor.map(_fetch_results, page_params))
+        else:
+            page_results = [_fetch_results(params)]
     
-    data = response.json()
-    
-    # Extract the results from the response
-    results = data.get("results", [])
+    results = [result for page_result in page_results for result in page_result]
     
     if not results:
         return pd.DataFrame()
     
-    # Convert results to DataFrame
-    df = pd.DataFrame(results)
+    # Convert results to DataFrame, flattening nested JSON objects into
+    # prefixed columns (e.g. "parent_child") in a single pass
+    df = pd.DataFrame([_flatten(result) for result in results])
+    
+    # Make sure list columns always hold lists so consumers can join them directly
+    for col in LIST_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].map(_as_list)
+    df.attrs[_LISTS_NORMALIZED_ATTR] = True
     
-    # Flatten any nested JSON columns
-    for col in df.select_dtypes(include=['object']):
-        if isinstance(df[col].iloc[0], dict):
-            nested_df = pd.json_normalize(df[col].tolist())
-            # Prefix nested columns with original column name
-            nested_df.columns = [f"{col}_{subcol}" for subcol in nested_df.columns]
-            # Drop the original column and join the flattened columns
-            df = df.drop(columns=[col]).join(nested_df)
+    # Optionally store columns in nullable/Arrow-backed dtypes; list columns
+    # such as authors and topics are left as Python objects
+    if dtype_backend is not None:
+        df = df.convert_dtypes(dtype_backend=dtype_backend)
     
     if export_to_csv:
         export_df = prepare_dataframe_for_export(df)
-        export_df.to_csv(csv_filename, index=False)
+        write_csv(export_df, csv_filename)
     
     return df
-
-def get_available_topics() -> List[str]:
-    """
-    Get a list of available topics from O'Reilly's API.
-    Currently returns a curated list of common topics.
-    
-    Returns:
-        List of topic strings
-    """
-    # This is a curated list of common topics
-    # In a production environment, you might want to fetch this from the API
-    return [
-        "python",
-        "javascript",
-        "java",
-        "data-science",
-        "machine-learning",
-        "web-development",
-        "devops",
-        "security",
-        "cloud",
-        "databases",
-        "programming",
-        "software-engineering",
-        "artificial-intelligence",
-        "data-analysis",
-        "deep-learning",
-        "statistics",
-        "big-data"
-    ]
@@ -2,7 +2,7 @@
 import click
 from typing import List, Optional
 from datetime import datetime, date
-from . import api
+from . import topics as topic_listing
 
 def parse_date(ctx, param, value) -> Optional[date]:
     """Parse date from string in YYYY-MM-DD format."""
@@ -13,6 +13,12 @@ def parse_date(ctx, param, value) -> Optional[date]:
     except ValueError:
         raise click.BadParameter("Date must be in YYYY-MM-DD format")
 
+def column_values(df, column: str, default):
+    """Return the values of a DataFrame column, or `default` for every row if it is missing."""
+    if column in df.columns:
+        return df[column].to_numpy()
+    return [default] * len(df)
+
 @click.group()
 def cli():
     """Search and explore O'Reilly books."""
@@ -25,10 +31,12 @@ def cli():
 @click.option('--before', callback=parse_date, help='Only show books published before date (YYYY-MM-DD)')
 @click.option('--limit', '-l', default=10, help='Number of results to return')
 @click.option('--page', '-p', default=0, help='Page number for pagination')
+@click.option('--pages', default=1, type=click.IntRange(min=1), help='Number of consecutive pages to fetch')
 @click.option('--output', '-o', type=click.Path(), help='Save results to CSV file')
 @click.option('--topic', '-t', multiple=True, help='Filter by topic (can be used multiple times)')
 @click.option('--list-topics', is_flag=True, help='List available topics')
 @click.option('--all-topics', is_flag=True, help='Search all topics (disable default data science filter)')
+@click.option('--no-cache', is_flag=True, help='Bypass the local response cache')
 def search(
     query: str,
     author: str,
@@ -36,10 +44,12 @@ def search(
     before: date,
     limit: int,
     page: int,
+    pages: int,
     output: str,
     topic: List[str],
     list_topics: bool,
-    all_topics: bool
+    all_topics: bool,
+    no_cache: bool
 ):
     """
     Search for books by title, content, or author. By default, searches only data science and AI topics.
@@ -60,11 +70,14 @@ def search(
         # Search with custom topics
         bookfinder search "python" --topic web-development
         
+        # Fetch several pages of results at once
+        bookfinder search "python" --page 0 --pages 3
+        
         # Export results to CSV
         bookfinder search "python" --output results.csv
     """
     if list_topics:
-        topics = api.get_available_topics()
+        topics = topic_listing.get_available_topics()
         click.echo("\nAvailable topics:")
         for t in topics:
             click.echo(f"- {t}")
@@ -74,6 +87,12 @@ def search(
         click.echo("Please provide either a search query or an author name.")
         return
         
+    # Imported here so --help and --list-topics don't pay for loading pandas
+    from . import api
+    
+    # Release pooled API connections when the command finishes
+    click.get_current_context().call_on_close(api.close)
+    
     try:
         df = api.search_books(
             query=query or "", 
@@ -82,8 +101,10 @@ def search(
             published_before=before,
             limit=limit, 
             page=page, 
+            pages=pages,
             topics=list(topic) if topic else None,
-            use_default_topics=not all_topics
+            use_default_topics=not all_topics,
+            use_cache=not no_cache
         )
         
         if df.empty:
@@ -91,19 +112,31 @@ def search(
             return
             
         # Display basic information about each book
-        for _, row in df.iterrows():
-            click.echo(f"\nTitle: {row.get('title', 'N/A')}")
-            click.echo(f"Authors: {', '.join(row.get('authors', []))}")
-            click.echo(f"Published: {row.get('issued', 'N/A')}")
-            click.echo(f"URL: {row.get('web_url', 'N/A')}")
-            if 'topics' in row:
-                click.echo(f"Topics: {', '.join(row.get('topics', []))}")
-            click.echo("-" * 80)
+        has_topics = 'topics' in df.columns
+        rows = zip(
+            column_values(df, 'title', 'N/A'),
+            column_values(df, 'authors', []),
+            column_values(df, 'issued', 'N/A'),
+            column_values(df, 'web_url', 'N/A'),
+            column_values(df, 'topics', [])
+        )
+        separator = "-" * 80
+        lines = []
+        for title, authors, issued, url, topics in rows:
+            lines.append(f"\nTitle: {title}")
+            lines.append(f"Authors: {', '.join(authors)}")
+            lines.append(f"Published: {issued}")
+            lines.append(f"URL: {url}")
+            if has_topics:
+                lines.append(f"Topics: {', '.join(topics)}")
+            lines.append(separator)
+        # Write all results at once rather than one echo per line
+        click.echo("\n".join(lines))
         
         if output:
             # Use the enhanced export functionality
             export_df = api.prepare_dataframe_for_export(df)
-            export_df.to_csv(output, index=False)
+            api.write_csv(export_df, output)
             click.echo(f"\nResults exported to {output} with the following columns:")
             click.echo(", ".join(export_df.columns))
             
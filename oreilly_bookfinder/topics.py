@@ -0,0 +1,37 @@
+"""Topic listings for O'Reilly Bookfinder.
+
+Kept separate from the api module so it can be used without importing pandas.
+"""
+from functools import lru_cache
+from typing import Tuple
+
+@lru_cache(maxsize=1)
+def get_available_topics() -> Tuple[str, ...]:
+    """
+    Get the available topics from O'Reilly's API.
+    Currently returns a curated list of common topics.
+    
+    Returns:
+        Tuple of topic strings
+    """
+    # This is a curated list of common topics
+    # In a production environment, you might want to fetch this from the API
+    return (
+        "python",
+        "javascript",
+        "java",
+        "data-science",
+        "machine-learning",
+        "web-development",
+        "devops",
+        "security",
+        "cloud",
+        "databases",
+        "programming",
+        "software-engineering",
+        "artificial-intelligence",
+        "data-analysis",
+        "deep-learning",
+        "statistics",
+        "big-data"
+    )